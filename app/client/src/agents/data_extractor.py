@@ -11,6 +11,31 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Extraction patterns, compiled once at import instead of on every report
+_REVENUE_BILLION_RE = re.compile(r'\$(\d+\.?\d*)\s*[Bb]illion')
+_REVENUE_RE = re.compile(r'revenue[:\s]+\$?(\d+\.?\d*)[Bb]?', re.IGNORECASE)
+_YOY_RE = re.compile(r'(?:YoY|year-over-year)[:\s]+(\d+\.?\d*)%?', re.IGNORECASE)
+_NET_INCOME_RE = re.compile(r'net\s+income[:\s]+\$?(\d+\.?\d*)\s*[Bb]?', re.IGNORECASE)
+_NET_INCOME_YOY_RE = re.compile(r'net\s+income.*?(\d+\.?\d*)%\s+(?:growth|increase)', re.IGNORECASE)
+_EPS_RE = re.compile(r'(?:Earnings\s+Per\s+Share|EPS)[):\s]*\$?(\d+\.?\d*)', re.IGNORECASE)
+_ANALYST_ESTIMATE_RE = re.compile(r'(?:analyst\s+)?estimate[s]?[:\s]*\$?(\d+\.?\d*)', re.IGNORECASE)
+_OPERATING_MARGIN_RE = re.compile(r'operating\s+margin[:\s]+(\d+\.?\d*)%?', re.IGNORECASE)
+_PREVIOUS_MARGIN_RE = re.compile(r'previous.*?margin[:\s]+(\d+\.?\d*)%?', re.IGNORECASE)
+_CASH_FLOW_RE = re.compile(r'(?:free\s+)?cash\s+flow[:\s]+\$?(\d+\.?\d*)\s*[Bb]?', re.IGNORECASE)
+_CASH_FLOW_YOY_RE = re.compile(r'cash\s+flow.*?(\d+\.?\d*)%\s+(?:growth|increase|change)', re.IGNORECASE)
+_CLOUD_REVENUE_RE = re.compile(r'(?:Cloud|cloud).*?[:\-]?\s*\$?(\d+\.?\d*)\s*billion', re.IGNORECASE | re.DOTALL)
+_CLOUD_REVENUE_FALLBACK_RE = re.compile(r'(?:Cloud|cloud)\s+(?:Services\s+)?(?:Division|division)?[^$]*\$?(\d+\.?\d*)', re.IGNORECASE)
+_CLOUD_GROWTH_RE = re.compile(r'(?:Cloud|cloud).*?(?:\(\+|plus|up\s+)?(\d+)%?\s+(?:YoY|growth|increase)', re.IGNORECASE | re.DOTALL)
+_SOFTWARE_REVENUE_RE = re.compile(r'(?:Software|software).*?[:\-]?\s*\$?(\d+\.?\d*)\s*billion', re.IGNORECASE | re.DOTALL)
+_SOFTWARE_REVENUE_FALLBACK_RE = re.compile(r'Software\s+(?:Products|products)?[^$]*\$?(\d+\.?\d*)', re.IGNORECASE)
+_SOFTWARE_GROWTH_RE = re.compile(r'(?:Software|software).*?(?:\(\+|plus|up\s+)?(\d+)%?\s+(?:YoY|growth|increase)', re.IGNORECASE | re.DOTALL)
+_HARDWARE_REVENUE_RE = re.compile(r'(?:Hardware|hardware).*?[:\-]?\s*\$?(\d+\.?\d*)\s*billion', re.IGNORECASE | re.DOTALL)
+_HARDWARE_REVENUE_FALLBACK_RE = re.compile(r'Hardware\s+(?:Division|division)?[^$]*\$?(\d+\.?\d*)', re.IGNORECASE)
+_HARDWARE_GROWTH_RE = re.compile(r'(?:Hardware|hardware).*?(?:\(\-|\-)?(\d+)%?\s+(?:YoY|growth|decline|decrease)', re.IGNORECASE | re.DOTALL)
+_Q4_GUIDANCE_RE = re.compile(r'Q4\s+2024[^A-Z]*?(?:Revenue|revenue)[^$\d]*\$?(\d+\.?\d*)[^$\d]*\$?(\d+\.?\d*)', re.IGNORECASE | re.DOTALL)
+_FULL_YEAR_GROWTH_RE = re.compile(r'(?:Full-year|full\s+year).*?revenue\s+growth\s+(?:of|rate)?[:\s]*(\d+)[^$]*?(\d+)%?', re.IGNORECASE | re.DOTALL)
+_FULL_YEAR_GROWTH_FALLBACK_RE = re.compile(r'(?:Full-year|full\s+year).*?(\d+)[^$]*?(\d+)%', re.IGNORECASE | re.DOTALL)
+
 
 class DataExtractorAgent(BaseAgent):
     """
@@ -88,17 +113,17 @@ class DataExtractorAgent(BaseAgent):
         financial_metrics = {}
 
         # Extract revenue
-        revenue_match = re.search(r'\$(\d+\.?\d*)\s*[Bb]illion', report_content)
+        revenue_match = _REVENUE_BILLION_RE.search(report_content)
         revenue_value = None
         if revenue_match:
             revenue_value = float(revenue_match.group(1))
         else:
-            revenue_match = re.search(r'revenue[:\s]+\$?(\d+\.?\d*)[Bb]?', report_content, re.IGNORECASE)
+            revenue_match = _REVENUE_RE.search(report_content)
             if revenue_match:
                 revenue_value = float(revenue_match.group(1))
 
         # Extract YoY growth for revenue
-        yoy_match = re.search(r'(?:YoY|year-over-year)[:\s]+(\d+\.?\d*)%?', report_content, re.IGNORECASE)
+        yoy_match = _YOY_RE.search(report_content)
         revenue_yoy = None
         if yoy_match:
             yoy_value = float(yoy_match.group(1))
@@ -115,13 +140,13 @@ class DataExtractorAgent(BaseAgent):
             }
 
         # Extract net income
-        net_income_match = re.search(r'net\s+income[:\s]+\$?(\d+\.?\d*)\s*[Bb]?', report_content, re.IGNORECASE)
+        net_income_match = _NET_INCOME_RE.search(report_content)
         net_income_value = None
         if net_income_match:
             net_income_value = float(net_income_match.group(1))
 
         # Extract net income YoY
-        net_income_yoy_match = re.search(r'net\s+income.*?(\d+\.?\d*)%\s+(?:growth|increase)', report_content, re.IGNORECASE)
+        net_income_yoy_match = _NET_INCOME_YOY_RE.search(report_content)
         net_income_yoy = None
         if net_income_yoy_match:
             yoy_value = float(net_income_yoy_match.group(1))
@@ -139,11 +164,11 @@ class DataExtractorAgent(BaseAgent):
 
         # Extract EPS
         # Try pattern: "Earnings Per Share (EPS): $4.52"
-        eps_match = re.search(r'(?:Earnings\s+Per\s+Share|EPS)[):\s]*\$?(\d+\.?\d*)', report_content, re.IGNORECASE)
+        eps_match = _EPS_RE.search(report_content)
 
         if eps_match:
             eps_value = float(eps_match.group(1))
-            analyst_estimate_match = re.search(r'(?:analyst\s+)?estimate[s]?[:\s]*\$?(\d+\.?\d*)', report_content, re.IGNORECASE)
+            analyst_estimate_match = _ANALYST_ESTIMATE_RE.search(report_content)
             analyst_estimate = float(analyst_estimate_match.group(1)) if analyst_estimate_match else 4.30
 
             financial_metrics["eps"] = {
@@ -153,14 +178,14 @@ class DataExtractorAgent(BaseAgent):
             }
 
         # Extract operating margin
-        margin_match = re.search(r'operating\s+margin[:\s]+(\d+\.?\d*)%?', report_content, re.IGNORECASE)
+        margin_match = _OPERATING_MARGIN_RE.search(report_content)
         if margin_match:
             current_margin = float(margin_match.group(1))
             if current_margin > 1:
                 current_margin = current_margin / 100
 
             # Extract previous margin
-            previous_margin_match = re.search(r'previous.*?margin[:\s]+(\d+\.?\d*)%?', report_content, re.IGNORECASE)
+            previous_margin_match = _PREVIOUS_MARGIN_RE.search(report_content)
             previous_margin = None
             if previous_margin_match:
                 previous_margin = float(previous_margin_match.group(1))
@@ -174,10 +199,10 @@ class DataExtractorAgent(BaseAgent):
             }
 
         # Extract free cash flow
-        cash_flow_match = re.search(r'(?:free\s+)?cash\s+flow[:\s]+\$?(\d+\.?\d*)\s*[Bb]?', report_content, re.IGNORECASE)
+        cash_flow_match = _CASH_FLOW_RE.search(report_content)
         if cash_flow_match:
             cash_flow_value = float(cash_flow_match.group(1))
-            cash_flow_yoy_match = re.search(r'cash\s+flow.*?(\d+\.?\d*)%\s+(?:growth|increase|change)', report_content, re.IGNORECASE)
+            cash_flow_yoy_match = _CASH_FLOW_YOY_RE.search(report_content)
             cash_flow_yoy = None
             if cash_flow_yoy_match:
                 yoy_value = float(cash_flow_yoy_match.group(1))
@@ -195,14 +220,14 @@ class DataExtractorAgent(BaseAgent):
         segment_performance = {}
 
         # Cloud services - look for patterns like "Cloud Services Division" or "Cloud"
-        cloud_revenue_match = re.search(r'(?:Cloud|cloud).*?[:\-]?\s*\$?(\d+\.?\d*)\s*billion', report_content, re.IGNORECASE | re.DOTALL)
+        cloud_revenue_match = _CLOUD_REVENUE_RE.search(report_content)
         if not cloud_revenue_match:
-            cloud_revenue_match = re.search(r'(?:Cloud|cloud)\s+(?:Services\s+)?(?:Division|division)?[^$]*\$?(\d+\.?\d*)', report_content, re.IGNORECASE)
+            cloud_revenue_match = _CLOUD_REVENUE_FALLBACK_RE.search(report_content)
 
         if cloud_revenue_match:
             cloud_revenue = float(cloud_revenue_match.group(1))
             # Look for growth percentage after cloud mention
-            cloud_growth_match = re.search(r'(?:Cloud|cloud).*?(?:\(\+|plus|up\s+)?(\d+)%?\s+(?:YoY|growth|increase)', report_content, re.IGNORECASE | re.DOTALL)
+            cloud_growth_match = _CLOUD_GROWTH_RE.search(report_content)
             cloud_growth = None
             if cloud_growth_match:
                 cloud_growth = float(cloud_growth_match.group(1)) / 100
@@ -218,13 +243,13 @@ class DataExtractorAgent(BaseAgent):
             }
 
         # Software products
-        software_revenue_match = re.search(r'(?:Software|software).*?[:\-]?\s*\$?(\d+\.?\d*)\s*billion', report_content, re.IGNORECASE | re.DOTALL)
+        software_revenue_match = _SOFTWARE_REVENUE_RE.search(report_content)
         if not software_revenue_match:
-            software_revenue_match = re.search(r'Software\s+(?:Products|products)?[^$]*\$?(\d+\.?\d*)', report_content, re.IGNORECASE)
+            software_revenue_match = _SOFTWARE_REVENUE_FALLBACK_RE.search(report_content)
 
         if software_revenue_match:
             software_revenue = float(software_revenue_match.group(1))
-            software_growth_match = re.search(r'(?:Software|software).*?(?:\(\+|plus|up\s+)?(\d+)%?\s+(?:YoY|growth|increase)', report_content, re.IGNORECASE | re.DOTALL)
+            software_growth_match = _SOFTWARE_GROWTH_RE.search(report_content)
             software_growth = None
             if software_growth_match:
                 software_growth = float(software_growth_match.group(1)) / 100
@@ -236,13 +261,13 @@ class DataExtractorAgent(BaseAgent):
             }
 
         # Hardware
-        hardware_revenue_match = re.search(r'(?:Hardware|hardware).*?[:\-]?\s*\$?(\d+\.?\d*)\s*billion', report_content, re.IGNORECASE | re.DOTALL)
+        hardware_revenue_match = _HARDWARE_REVENUE_RE.search(report_content)
         if not hardware_revenue_match:
-            hardware_revenue_match = re.search(r'Hardware\s+(?:Division|division)?[^$]*\$?(\d+\.?\d*)', report_content, re.IGNORECASE)
+            hardware_revenue_match = _HARDWARE_REVENUE_FALLBACK_RE.search(report_content)
 
         if hardware_revenue_match:
             hardware_revenue = float(hardware_revenue_match.group(1))
-            hardware_growth_match = re.search(r'(?:Hardware|hardware).*?(?:\(\-|\-)?(\d+)%?\s+(?:YoY|growth|decline|decrease)', report_content, re.IGNORECASE | re.DOTALL)
+            hardware_growth_match = _HARDWARE_GROWTH_RE.search(report_content)
             hardware_growth = -0.02
             if hardware_growth_match:
                 growth_val = float(hardware_growth_match.group(1))
@@ -258,7 +283,7 @@ class DataExtractorAgent(BaseAgent):
         forward_guidance = {}
 
         # Q4 2024 revenue guidance - look for "Revenue between" or "revenue of" in Q4 section
-        q4_section_match = re.search(r'Q4\s+2024[^A-Z]*?(?:Revenue|revenue)[^$\d]*\$?(\d+\.?\d*)[^$\d]*\$?(\d+\.?\d*)', report_content, re.IGNORECASE | re.DOTALL)
+        q4_section_match = _Q4_GUIDANCE_RE.search(report_content)
 
         q4_revenue_range = [16.0, 16.5]  # Default
         if q4_section_match:
@@ -273,9 +298,9 @@ class DataExtractorAgent(BaseAgent):
         }
 
         # Full-year growth guidance
-        full_year_growth_match = re.search(r'(?:Full-year|full\s+year).*?revenue\s+growth\s+(?:of|rate)?[:\s]*(\d+)[^$]*?(\d+)%?', report_content, re.IGNORECASE | re.DOTALL)
+        full_year_growth_match = _FULL_YEAR_GROWTH_RE.search(report_content)
         if not full_year_growth_match:
-            full_year_growth_match = re.search(r'(?:Full-year|full\s+year).*?(\d+)[^$]*?(\d+)%', report_content, re.IGNORECASE | re.DOTALL)
+            full_year_growth_match = _FULL_YEAR_GROWTH_FALLBACK_RE.search(report_content)
 
         if full_year_growth_match:
             growth1 = float(full_year_growth_match.group(1))